@@ -7,13 +7,23 @@ using Zig as the build dependency.
 """
 
 import argparse
+import hashlib
+import http.client
 import os
+import queue
+import re
+import shutil
 import subprocess
 import sys
 import tarfile
 import tempfile
+import threading
+import time
+import urllib.error
 import urllib.request
 import zipfile
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
@@ -30,24 +40,197 @@ class Colors:
     END = "\033[0m"
 
 
+# Chunk size used when streaming downloads to disk
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Retry policy for interrupted downloads: attempts after the first one, and the
+# base delay in seconds, doubled after every failed attempt
+DOWNLOAD_RETRIES = 3
+DOWNLOAD_BACKOFF = 0.5
+
+# Socket timeout in seconds for HTTP connections
+HTTP_TIMEOUT = 30
+
+# Persistent download cache, shared across working directories. Files are
+# stored content-addressed as <sha256>/<filename>; urls/<sha256 of url> maps a
+# download URL to the digest of its content.
+CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "ghostty-build"
+)
+
+# Archive suffixes supported by extract(), mapped to their tar compression
+# ("zip" archives are handled by zipfile instead)
+ARCHIVE_FORMATS = {
+    ".tar.gz": "gz",
+    ".tar.xz": "xz",
+    ".zip": "zip",
+}
+
+# External decompressors that use more than one core, preferred over the
+# single-threaded codecs in tarfile when they are installed
+DECOMPRESSORS = {
+    "gz": ["pigz", "-dc"],
+    "xz": ["xz", "-T0", "-dc"],
+}
+
+
 def log_info(message: str) -> None:
     """Print info message with blue color."""
-    print(f"{Colors.BLUE}[INFO]{Colors.END} {message}")
+    print(f"{Colors.BLUE}[INFO]{Colors.END} {message}", flush=True)
 
 
 def log_success(message: str) -> None:
     """Print success message with green color."""
-    print(f"{Colors.GREEN}[SUCCESS]{Colors.END} {message}")
+    print(f"{Colors.GREEN}[SUCCESS]{Colors.END} {message}", flush=True)
 
 
 def log_warning(message: str) -> None:
     """Print warning message with yellow color."""
-    print(f"{Colors.YELLOW}[WARNING]{Colors.END} {message}")
+    print(f"{Colors.YELLOW}[WARNING]{Colors.END} {message}", flush=True)
 
 
 def log_error(message: str) -> None:
     """Print error message with red color."""
-    print(f"{Colors.RED}[ERROR]{Colors.END} {message}")
+    print(f"{Colors.RED}[ERROR]{Colors.END} {message}", flush=True)
+
+
+def iter_response_chunks(url: str, offset: int = 0) -> Iterator[bytes]:
+    """Yield the body of url from offset onwards in chunks.
+
+    A Range header asks for the remaining bytes only; if the server ignores it,
+    the bytes before offset are read and skipped.
+    """
+    headers = {"Range": f"bytes={offset}-"} if offset else {}
+    request = urllib.request.Request(url, headers=headers)
+    with urllib.request.urlopen(request, timeout=HTTP_TIMEOUT) as response:
+        skip = offset if response.status != 206 else 0
+        while skip:
+            data = response.read(min(skip, DOWNLOAD_CHUNK_SIZE))
+            if not data:
+                raise http.client.IncompleteRead(b"", skip)
+            skip -= len(data)
+
+        while chunk := response.read(DOWNLOAD_CHUNK_SIZE):
+            yield chunk
+
+        # http.client does not raise on a body cut short of Content-Length
+        if response.length:
+            raise http.client.IncompleteRead(b"", response.length)
+
+
+def fetch_url(url: str, consume: Callable[[bytes], None]) -> None:
+    """Stream the body of url into consume in chunks.
+
+    Interrupted transfers are retried with exponential backoff and resumed from
+    the last received byte using a Range request.
+    """
+    received = 0
+    for attempt in range(DOWNLOAD_RETRIES + 1):
+        chunks = iter_response_chunks(url, received)
+        try:
+            while True:
+                # Only the transfer itself is retried; errors raised by consume
+                # (e.g. a full disk) are local and propagate unchanged
+                try:
+                    chunk = next(chunks, None)
+                except urllib.error.HTTPError:
+                    raise
+                except (OSError, http.client.HTTPException) as e:
+                    error = e
+                    break
+
+                if chunk is None:
+                    return
+                consume(chunk)
+                received += len(chunk)
+        finally:
+            chunks.close()
+
+        if attempt == DOWNLOAD_RETRIES:
+            raise error
+        delay = DOWNLOAD_BACKOFF * 2**attempt
+        log_warning(f"Download of {url} interrupted ({error!r}), retrying in {delay}s")
+        time.sleep(delay)
+
+
+def file_sha256(path: Path) -> str:
+    """Return the hex SHA-256 digest of a file.
+
+    hashlib.file_digest reads straight into the hash object and runs
+    OpenSSL's SHA-256 (SHA-NI where available) without holding the GIL.
+    """
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def link_or_copy(source: Path, destination: Path) -> None:
+    """Hardlink source to destination, falling back to a copy across filesystems."""
+    destination.unlink(missing_ok=True)
+    try:
+        os.link(source, destination)
+    except OSError:
+        shutil.copy2(source, destination)
+
+
+def cache_index_path(url: str) -> Path:
+    """Return the cache index file recording the content digest for url."""
+    return CACHE_DIR / "urls" / hashlib.sha256(url.encode()).hexdigest()
+
+
+def cache_lookup(url: str) -> Path | None:
+    """Return the cached copy of the file at url, or None if it is not cached."""
+    try:
+        digest = cache_index_path(url).read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+
+    cached = CACHE_DIR / digest / url.rsplit("/", 1)[-1]
+    if not cached.is_file():
+        return None
+
+    # Entries are hardlinked into working directories, so make sure none was
+    # modified in place before trusting it
+    if file_sha256(cached) != digest:
+        log_warning(f"Discarding corrupted cache entry {cached}")
+        cached.unlink(missing_ok=True)
+        return None
+
+    return cached
+
+
+def cache_store(url: str, path: Path, digest: str) -> None:
+    """Add a downloaded file to the cache under its content digest."""
+    try:
+        entry = CACHE_DIR / digest / url.rsplit("/", 1)[-1]
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        if not entry.exists():
+            link_or_copy(path, entry)
+
+        index_file = cache_index_path(url)
+        index_file.parent.mkdir(parents=True, exist_ok=True)
+        index_file.write_text(digest, encoding="utf-8")
+    except OSError as e:
+        log_warning(f"Failed to cache {path.name}: {e}")
+
+
+def restore_from_cache(url: str, destination: Path) -> str | None:
+    """Link a cached copy of url to destination.
+
+    Returns: the verified SHA-256 of the file on a cache hit, otherwise None
+    """
+    cached = cache_lookup(url)
+    if cached is None:
+        return None
+
+    try:
+        link_or_copy(cached, destination)
+    except OSError as e:
+        log_warning(f"Failed to restore {destination.name} from cache: {e}")
+        return None
+
+    log_info(f"Using cached {destination.name} from {cached.parent}")
+    # Entries are content-addressed, so the directory name is the digest
+    return cached.parent.name
 
 
 def download_file(url: str, destination: Path, pull_always: bool = False) -> None:
@@ -57,45 +240,271 @@ def download_file(url: str, destination: Path, pull_always: bool = False) -> Non
         log_info(f"File {destination.name} already exists, skipping download")
         return
 
+    if not pull_always and restore_from_cache(url, destination):
+        return
+
     log_info(f"Downloading {url} to {destination}")
+    # Stream into a sibling .part file so a failed download never leaves a
+    # truncated file that later runs would mistake for a complete one
+    part_file = destination.with_name(f"{destination.name}.part")
     try:
-        urllib.request.urlretrieve(url, destination)
+        digest = hashlib.sha256()
+        with open(part_file, "wb") as f:
+
+            def consume(chunk: bytes) -> None:
+                f.write(chunk)
+                digest.update(chunk)
+
+            fetch_url(url, consume)
+        # Replacing also never writes through an existing hardlink into the cache
+        os.replace(part_file, destination)
         log_success(f"Downloaded {destination.name}")
     except Exception as e:
+        part_file.unlink(missing_ok=True)
         log_error(f"Failed to download {url}: {e}")
         sys.exit(1)
 
+    cache_store(url, destination, digest.hexdigest())
 
-def extract_tar_gz(archive_path: Path, extract_to: Path) -> None:
-    """Extract a .tar.gz file to the specified directory."""
-    log_info(f"Extracting {archive_path.name} to {extract_to}")
+
+class ChunkReader:
+    """Minimal file-like reader over a queue of byte chunks.
+
+    A ``None`` item marks the end of the stream. Reads may be short, which
+    tarfile's streaming mode handles.
+    """
+
+    def __init__(self, chunks: "queue.Queue[bytes | None]") -> None:
+        self._chunks = chunks
+        self._chunk = b""
+        self._offset = 0
+        self._eof = False
+
+    def read(self, size: int = -1) -> bytes:
+        if self._offset >= len(self._chunk):
+            if self._eof:
+                return b""
+            chunk = self._chunks.get()
+            if chunk is None:
+                self._eof = True
+                return b""
+            self._chunk, self._offset = chunk, 0
+
+        end = len(self._chunk) if size < 0 else self._offset + size
+        data = self._chunk[self._offset : end]
+        self._offset += len(data)
+        return data
+
+    def drain(self) -> None:
+        """Consume remaining chunks so the producer is never left blocked."""
+        while not self._eof:
+            if self._chunks.get() is None:
+                self._eof = True
+
+
+def archive_format(archive_path: Path) -> str:
+    """Return the ARCHIVE_FORMATS entry matching the name of archive_path."""
+    for suffix, archive_type in ARCHIVE_FORMATS.items():
+        if archive_path.name.endswith(suffix):
+            return archive_type
+    raise ValueError(f"Unsupported archive format: {archive_path.name}")
+
+
+def start_decompressor(
+    compression: str, archive_path: Path | None = None
+) -> "subprocess.Popen[bytes] | None":
+    """Start an external decompressor for the given compression, if available.
+
+    The decompressor reads archive_path, or its stdin when no path is given,
+    and writes the plain tar stream to its stdout. Returns None if the tool
+    is not installed.
+    """
+    command = DECOMPRESSORS[compression]
+    if shutil.which(command[0]) is None:
+        return None
+
+    if archive_path is None:
+        return subprocess.Popen(
+            command, stdin=subprocess.PIPE, stdout=subprocess.PIPE
+        )
+    return subprocess.Popen(
+        [*command, str(archive_path)],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+    )
+
+
+def extract_members(
+    tar: tarfile.TarFile, extract_to: Path, strip_components: int = 0
+) -> None:
+    """Extract all members of tar, dropping leading path components.
+
+    Like tar's --strip-components, this writes files straight to their final
+    location instead of moving them out of a top-level directory afterwards.
+    The "data" filter rejects unsafe members and skips restoring ownership.
+    """
+
+    def stripped(path: str) -> str:
+        return "/".join(path.split("/")[strip_components:])
+
+    def members() -> Iterator[tarfile.TarInfo]:
+        for member in tar:
+            if strip_components:
+                member.name = stripped(member.name)
+                if not member.name:
+                    continue
+                # Hard links refer to other members by their archive path
+                if member.islnk():
+                    member.linkname = stripped(member.linkname)
+            yield member
+
+    tar.extractall(extract_to, members=members(), filter="data")
+
+
+def extract_decompressed_tar(
+    decompressor: "subprocess.Popen[bytes]",
+    extract_to: Path,
+    strip_components: int = 0,
+) -> None:
+    """Extract the plain tar stream written by an external decompressor."""
+    assert decompressor.stdout is not None
     try:
-        with tarfile.open(archive_path, "r:gz") as tar:
-            tar.extractall(extract_to)
-        log_success(f"Extracted {archive_path.name}")
-    except Exception as e:
-        log_error(f"Failed to extract {archive_path}: {e}")
-        sys.exit(1)
+        with tarfile.open(fileobj=decompressor.stdout, mode="r|") as tar:
+            extract_members(tar, extract_to, strip_components)
+    finally:
+        # Consume trailing padding so the decompressor can run to completion
+        while decompressor.stdout.read(DOWNLOAD_CHUNK_SIZE):
+            pass
+        decompressor.stdout.close()
+        returncode = decompressor.wait()
+
+    if returncode != 0:
+        raise RuntimeError(f"{decompressor.args[0]} exited with status {returncode}")
+
+
+def download_and_extract(
+    url: str,
+    destination: Path,
+    extract_to: Path,
+    pull_always: bool = False,
+    strip_components: int = 0,
+) -> str | None:
+    """Download an archive and extract it while the download is in progress.
+
+    The archive is still written to destination so it can be validated and
+    reused by later runs.
+
+    Returns: the SHA-256 of the archive when it was downloaded or taken from
+    the cache, or None when an existing file was used as is
+    """
+    compression = archive_format(destination)
 
+    # Zip archives need random access, so they cannot be extracted as a stream
+    if compression == "zip":
+        download_file(url, destination, pull_always)
+        extract(destination, extract_to, strip_components)
+        return None
 
-def extract_tar_xz(archive_path: Path, extract_to: Path) -> None:
-    """Extract a .tar.xz file to the specified directory."""
-    log_info(f"Extracting {archive_path.name} to {extract_to}")
+    # Check if file already exists
+    if destination.exists() and not pull_always:
+        log_info(f"File {destination.name} already exists, skipping download")
+        extract(destination, extract_to, strip_components)
+        return None
+
+    if not pull_always and (cached_digest := restore_from_cache(url, destination)):
+        extract(destination, extract_to, strip_components)
+        return cached_digest
+
+    log_info(f"Downloading {url} to {destination} and extracting to {extract_to}")
+    chunks: "queue.Queue[bytes | None]" = queue.Queue(maxsize=16)
+    download_errors: list[Exception] = []
+    digest = hashlib.sha256()
+    decompressor = start_decompressor(compression)
+    # Only moved to destination once the archive is fully downloaded and extracted
+    part_file = destination.with_name(f"{destination.name}.part")
+
+    def feed(chunk: bytes | None) -> None:
+        if decompressor is None:
+            chunks.put(chunk)
+            return
+
+        assert decompressor.stdin is not None
+        try:
+            if chunk is None:
+                decompressor.stdin.close()
+            else:
+                decompressor.stdin.write(chunk)
+        except BrokenPipeError:
+            # The decompressor failed; its exit status is reported on extraction
+            pass
+
+    def fetch() -> None:
+        try:
+            with open(part_file, "wb") as f:
+
+                def consume(chunk: bytes) -> None:
+                    f.write(chunk)
+                    digest.update(chunk)
+                    feed(chunk)
+
+                fetch_url(url, consume)
+        except Exception as e:
+            download_errors.append(e)
+        finally:
+            feed(None)
+
+    fetcher = threading.Thread(target=fetch, daemon=True)
+    fetcher.start()
+
+    reader = ChunkReader(chunks)
+    extract_error = None
     try:
-        with tarfile.open(archive_path, "r:xz") as tar:
-            tar.extractall(extract_to)
-        log_success(f"Extracted {archive_path.name}")
+        if decompressor is not None:
+            extract_decompressed_tar(decompressor, extract_to, strip_components)
+        else:
+            with tarfile.open(fileobj=reader, mode=f"r|{compression}") as tar:
+                extract_members(tar, extract_to, strip_components)
     except Exception as e:
-        log_error(f"Failed to extract {archive_path}: {e}")
+        extract_error = e
+    finally:
+        if decompressor is None:
+            reader.drain()
+        fetcher.join()
+
+    if download_errors:
+        part_file.unlink(missing_ok=True)
+        log_error(f"Failed to download {url}: {download_errors[0]}")
         sys.exit(1)
+    if extract_error is not None:
+        part_file.unlink(missing_ok=True)
+        log_error(f"Failed to extract {destination}: {extract_error}")
+        sys.exit(1)
+
+    # Replacing also never writes through an existing hardlink into the cache
+    os.replace(part_file, destination)
+
+    log_success(f"Downloaded and extracted {destination.name}")
+    cache_store(url, destination, digest.hexdigest())
+    return digest.hexdigest()
 
 
-def extract_zip(archive_path: Path, extract_to: Path) -> None:
-    """Extract a .zip file to the specified directory."""
+def extract(archive_path: Path, extract_to: Path, strip_components: int = 0) -> None:
+    """Extract a .tar.gz, .tar.xz or .zip file to the specified directory."""
     log_info(f"Extracting {archive_path.name} to {extract_to}")
     try:
-        with zipfile.ZipFile(archive_path, "r") as zip_ref:
-            zip_ref.extractall(extract_to)
+        archive_type = archive_format(archive_path)
+        if archive_type == "zip":
+            if strip_components:
+                raise ValueError("strip_components is not supported for zip files")
+            with zipfile.ZipFile(archive_path, "r") as zip_ref:
+                zip_ref.extractall(extract_to)
+        else:
+            decompressor = start_decompressor(archive_type, archive_path)
+            if decompressor is not None:
+                extract_decompressed_tar(decompressor, extract_to, strip_components)
+            else:
+                with tarfile.open(archive_path, f"r:{archive_type}") as tar:
+                    extract_members(tar, extract_to, strip_components)
         log_success(f"Extracted {archive_path.name}")
     except Exception as e:
         log_error(f"Failed to extract {archive_path}: {e}")
@@ -103,15 +512,32 @@ def extract_zip(archive_path: Path, extract_to: Path) -> None:
 
 
 def validate_signature(
-    archive_path: Path, signature_path: Path, public_key: str
+    archive_path: Path,
+    signature_path: Path,
+    public_key: str,
+    archive_digest: str | None = None,
 ) -> bool:
-    """Validate the archive signature using minisign."""
+    """Validate the archive signature using minisign.
+
+    Successful validations are recorded in the cache under the archive's
+    SHA-256, so an identical archive is not verified again on later runs.
+    archive_digest, if already known, saves hashing the archive again.
+    """
     log_info("Validating signature...")
 
-    # Check if minisign is available
+    # Skip minisign if this exact archive already passed with the same key
+    if archive_digest is None:
+        archive_digest = file_sha256(archive_path)
+    sentinel = CACHE_DIR / "verified" / archive_digest
     try:
-        subprocess.run(["minisign", "-v"], capture_output=True, check=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
+        if sentinel.read_text(encoding="utf-8") == public_key:
+            log_success("Signature previously validated for this archive")
+            return True
+    except OSError:
+        pass
+
+    # Check if minisign is available
+    if shutil.which("minisign") is None:
         log_error(
             "minisign is not installed. Please install it to validate signatures."
         )
@@ -119,28 +545,34 @@ def validate_signature(
         sys.exit(1)
 
     try:
-        # Create a temporary file for the public key
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".pub", delete=False
-        ) as key_file:
-            key_file.write(public_key)
-            key_file_path = key_file.name
-
         # Debug: show the public key content
         log_info(f"Using public key: {public_key[:50]}...")
 
-        # Validate the signature
+        # Validate the signature, passing the key inline (the base64 line after
+        # the untrusted comment) instead of through a key file
+        key = public_key.strip().splitlines()[-1]
         result = subprocess.run(
-            ["minisign", "-V", "-p", key_file_path, "-m", str(archive_path)],
+            [
+                "minisign",
+                "-V",
+                "-P",
+                key,
+                "-m",
+                str(archive_path),
+                "-x",
+                str(signature_path),
+            ],
             capture_output=True,
             text=True,
         )
 
-        # Clean up the temporary key file
-        os.unlink(key_file_path)
-
         if result.returncode == 0:
             log_success("Signature validation passed")
+            try:
+                sentinel.parent.mkdir(parents=True, exist_ok=True)
+                sentinel.write_text(public_key, encoding="utf-8")
+            except OSError as e:
+                log_warning(f"Failed to record signature validation: {e}")
             return True
         else:
             log_error(f"Signature validation failed: {result.stderr}")
@@ -169,32 +601,31 @@ def setup_zig(compiler_dir: Path, zig_version: str, pull_always: bool = False) -
     zig_url = f"https://ziglang.org/download/{zig_version}/zig-x86_64-linux-{zig_version}.tar.xz"
     zig_archive = compiler_dir / "zig.tar.xz"
 
-    download_file(zig_url, zig_archive, pull_always)
-
-    # Extract Zig
-    extract_tar_xz(zig_archive, compiler_dir)
-    # Move zig binary and lib directory to the correct location
-    extracted_dir = compiler_dir / f"zig-x86_64-linux-{zig_version}"
-    if extracted_dir.exists():
-        # Move zig binary
-        zig_src = extracted_dir / "zig"
-        if zig_src.exists():
-            zig_src.rename(zig_binary)
-
-        # Move lib directory
-        lib_src = extracted_dir / "lib"
-        lib_dst = compiler_dir / "lib"
-        if lib_src.exists():
-            if lib_dst.exists():
-                import shutil
-
-                shutil.rmtree(lib_dst)
-            lib_src.rename(lib_dst)
-
-        # Clean up extracted directory
-        import shutil
+    # Download and extract Zig in a single pass into a staging directory,
+    # dropping the top-level zig-x86_64-linux-<version>/ directory. The
+    # installed toolchain is left untouched until extraction has succeeded.
+    staging_dir = Path(tempfile.mkdtemp(prefix=".zig-staging-", dir=compiler_dir))
+    try:
+        download_and_extract(
+            zig_url, zig_archive, staging_dir, pull_always, strip_components=1
+        )
 
-        shutil.rmtree(extracted_dir)
+        # Make sure the archive had the expected layout before touching the
+        # installed toolchain
+        for staged in (staging_dir / "zig", staging_dir / "lib"):
+            if not staged.exists():
+                log_error(f"Zig archive is missing {staged.name}, aborting setup")
+                sys.exit(1)
+
+        # Swap in lib first and the binary last, moving any previous lib into
+        # the staging directory so it is removed with it
+        lib_dir = compiler_dir / "lib"
+        if lib_dir.exists():
+            os.replace(lib_dir, staging_dir / "lib.old")
+        os.replace(staging_dir / "lib", lib_dir)
+        os.replace(staging_dir / "zig", zig_binary)
+    finally:
+        shutil.rmtree(staging_dir)
 
     # Clean up archive
     zig_archive.unlink()
@@ -202,42 +633,33 @@ def setup_zig(compiler_dir: Path, zig_version: str, pull_always: bool = False) -
     log_success("Zig compiler setup complete")
 
 
-def build_ghostty(ghostty_dir: Path, compiler_dir: Path) -> None:
-    """Build Ghostty using Zig."""
+def build_ghostty(ghostty_dir: Path, compiler_dir: Path, jobs: int) -> None:
+    """Build Ghostty using Zig with up to jobs parallel compile jobs."""
     log_info("Building Ghostty...")
 
     # Set up environment
     env = os.environ.copy()
     env["PATH"] = f"{compiler_dir}:{env.get('PATH', '')}"
 
-    # Change to ghostty directory
-    original_cwd = os.getcwd()
-    os.chdir(ghostty_dir)
-
-    try:
-        # Run the build command
-        result = subprocess.run(
-            [
-                "zig",
-                "build",
-                "-p",
-                str(Path.home() / ".local"),
-                "-Doptimize=ReleaseFast",
-            ],
-            env=env,
-            capture_output=True,
-            text=True,
-        )
-
-        if result.returncode != 0:
-            log_error("Build failed!")
-            log_error(result.stderr)
-            sys.exit(1)
+    # Run the build command, streaming its progress to the terminal
+    result = subprocess.run(
+        [
+            "zig",
+            "build",
+            "-p",
+            str(Path.home() / ".local"),
+            "-Doptimize=ReleaseFast",
+            f"-j{jobs}",
+        ],
+        cwd=ghostty_dir,
+        env=env,
+    )
 
-        log_success("Build completed successfully")
+    if result.returncode != 0:
+        log_error(f"Build failed with exit status {result.returncode}!")
+        sys.exit(1)
 
-    finally:
-        os.chdir(original_cwd)
+    log_success("Build completed successfully")
 
 
 def install_desktop_file(ghostty_dir: Path) -> None:
@@ -265,27 +687,37 @@ def install_app_desktop_file(ghostty_dir: Path) -> None:
     applications_dir = Path.home() / ".local" / "share" / "applications"
     applications_dir.mkdir(parents=True, exist_ok=True)
 
-    # Destination file
+    # Destination file, written through a sibling temporary file
     dest_desktop = applications_dir / "ghostty.desktop"
+    tmp_desktop = dest_desktop.with_suffix(".desktop.tmp")
 
     try:
         # Read source file
         with open(source_desktop, "r", encoding="utf-8") as f:
             content = f.read()
 
-        # Replace placeholders
-        ghostty_path = str(Path.home() / ".local" / "bin" / "ghostty")
-        content = content.replace("@GHOSTTY@", ghostty_path)
-        content = content.replace("@NAME@", "Ghostty")
-        content = content.replace("@APPID@", "com.mitchellh.ghostty")
+        # Replace placeholders in a single pass
+        placeholders = {
+            "GHOSTTY": str(Path.home() / ".local" / "bin" / "ghostty"),
+            "NAME": "Ghostty",
+            "APPID": "com.mitchellh.ghostty",
+        }
+        content = re.sub(
+            r"@(GHOSTTY|NAME|APPID)@",
+            lambda match: placeholders[match.group(1)],
+            content,
+        )
 
-        # Write to destination
-        with open(dest_desktop, "w", encoding="utf-8") as f:
+        # Write to destination atomically so an interrupted run never leaves
+        # a truncated desktop file behind
+        with open(tmp_desktop, "w", encoding="utf-8") as f:
             f.write(content)
+        os.replace(tmp_desktop, dest_desktop)
 
         log_success(f"Application desktop file installed to {dest_desktop}")
 
     except Exception as e:
+        tmp_desktop.unlink(missing_ok=True)
         log_error(f"Failed to install application desktop file: {e}")
 
 
@@ -303,21 +735,36 @@ def install_dolphin_desktop_file(ghostty_dir: Path) -> None:
     kio_dir = Path.home() / ".local" / "share" / "kio" / "servicemenus"
     kio_dir.mkdir(parents=True, exist_ok=True)
 
-    # Destination file
+    # Destination file, written through a sibling temporary file
     dest_desktop = kio_dir / "com.mitchellh.ghostty.desktop"
+    tmp_desktop = dest_desktop.with_suffix(".desktop.tmp")
 
     try:
-        # Copy file without modifications
-        import shutil
-
-        shutil.copy2(source_desktop, dest_desktop)
+        # Copy file without modifications, then atomically move it into place
+        shutil.copy2(source_desktop, tmp_desktop)
+        os.replace(tmp_desktop, dest_desktop)
 
         log_success(f"Dolphin service menu desktop file installed to {dest_desktop}")
 
     except Exception as e:
+        tmp_desktop.unlink(missing_ok=True)
         log_error(f"Failed to install Dolphin service menu desktop file: {e}")
 
 
+def remove_one(path: Path) -> tuple[Path, bool, Exception | None]:
+    """Remove a single file.
+
+    Returns: (path, removed, error) where removed is False if the file did not exist
+    """
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        return path, False, None
+    except Exception as e:
+        return path, False, e
+    return path, True, None
+
+
 def uninstall_ghostty() -> None:
     """Remove all installed Ghostty artifacts."""
     log_info("Uninstalling Ghostty...")
@@ -325,51 +772,39 @@ def uninstall_ghostty() -> None:
     removed_items = []
     failed_items = []
 
-    # Remove binary
-    ghostty_binary = Path.home() / ".local" / "bin" / "ghostty"
-    if ghostty_binary.exists():
-        try:
-            ghostty_binary.unlink()
-            removed_items.append(f"Binary: {ghostty_binary}")
-            log_success(f"Removed binary: {ghostty_binary}")
-        except Exception as e:
-            failed_items.append(f"Binary: {ghostty_binary} ({e})")
-            log_error(f"Failed to remove binary {ghostty_binary}: {e}")
-    else:
-        log_info("Binary not found, skipping removal")
+    # (summary label, log description, path) of every installed artifact
+    artifacts = [
+        ("Binary", "binary", Path.home() / ".local" / "bin" / "ghostty"),
+        (
+            "Application desktop file",
+            "application desktop file",
+            Path.home() / ".local" / "share" / "applications" / "ghostty.desktop",
+        ),
+        (
+            "Dolphin service menu",
+            "Dolphin service menu",
+            Path.home()
+            / ".local"
+            / "share"
+            / "kio"
+            / "servicemenus"
+            / "com.mitchellh.ghostty.desktop",
+        ),
+    ]
 
-    # Remove application desktop file
-    app_desktop = Path.home() / ".local" / "share" / "applications" / "ghostty.desktop"
-    if app_desktop.exists():
-        try:
-            app_desktop.unlink()
-            removed_items.append(f"Application desktop file: {app_desktop}")
-            log_success(f"Removed application desktop file: {app_desktop}")
-        except Exception as e:
-            failed_items.append(f"Application desktop file: {app_desktop} ({e})")
-            log_error(f"Failed to remove application desktop file {app_desktop}: {e}")
-    else:
-        log_info("Application desktop file not found, skipping removal")
-
-    # Remove Dolphin service menu desktop file
-    dolphin_desktop = (
-        Path.home()
-        / ".local"
-        / "share"
-        / "kio"
-        / "servicemenus"
-        / "com.mitchellh.ghostty.desktop"
-    )
-    if dolphin_desktop.exists():
-        try:
-            dolphin_desktop.unlink()
-            removed_items.append(f"Dolphin service menu: {dolphin_desktop}")
-            log_success(f"Removed Dolphin service menu: {dolphin_desktop}")
-        except Exception as e:
-            failed_items.append(f"Dolphin service menu: {dolphin_desktop} ({e})")
-            log_error(f"Failed to remove Dolphin service menu {dolphin_desktop}: {e}")
-    else:
-        log_info("Dolphin service menu not found, skipping removal")
+    # Remove all artifacts concurrently
+    with ThreadPoolExecutor(max_workers=len(artifacts)) as executor:
+        results = list(executor.map(remove_one, [path for _, _, path in artifacts]))
+
+    for (label, description, _), (path, removed, error) in zip(artifacts, results):
+        if error is not None:
+            failed_items.append(f"{label}: {path} ({error})")
+            log_error(f"Failed to remove {description} {path}: {error}")
+        elif removed:
+            removed_items.append(f"{label}: {path}")
+            log_success(f"Removed {description}: {path}")
+        else:
+            log_info(f"{label} not found, skipping removal")
 
     # Summary
     if removed_items:
@@ -396,13 +831,13 @@ def verify_build() -> bool:
 
     log_info("Verifying build artifacts...")
 
-    # Check if ghostty binary exists
+    # Check if ghostty binary exists and is executable
     ghostty_binary = bin_dir / "ghostty"
-    if ghostty_binary.exists():
+    if os.access(ghostty_binary, os.X_OK):
         log_success(f"Ghostty binary found at {ghostty_binary}")
         return True
     else:
-        log_error(f"Ghostty binary not found at {ghostty_binary}")
+        log_error(f"Ghostty binary not found or not executable at {ghostty_binary}")
         return False
 
 
@@ -420,64 +855,51 @@ def check_podman() -> bool:
 
 
 def extract_artifacts_from_container(
-    container_name: str, version: str, temp_dir: Path
+    image: str, version: str, temp_dir: Path
 ) -> tuple[Path, Path]:
-    """Extract binary and desktop files from container.
+    """Copy binary and desktop files out of the image through a bind mount.
 
     Returns: (binary_path, dist_dir_path)
     """
-    log_info("Extracting binary from container...")
-
-    # Extract binary
-    binary_path = temp_dir / "ghostty"
-    result = subprocess.run(
-        [
-            "podman",
-            "cp",
-            f"{container_name}:/build/output/bin/ghostty",
-            str(binary_path),
-        ],
-        capture_output=True,
-        text=True,
-    )
-
-    if result.returncode != 0:
-        log_error(f"Failed to extract binary from container: {result.stderr}")
-        raise RuntimeError("Binary extraction failed")
+    log_info("Extracting binary and desktop files from container...")
 
-    log_success("Binary extracted successfully")
-
-    # Extract desktop files
-    log_info("Extracting desktop files from container...")
-    dist_dir = temp_dir / "dist"
+    # A throwaway container copies the artifacts straight into temp_dir. It runs
+    # as container root, which rootless podman maps to the invoking user, so the
+    # copies are owned by them without remapping (and copying) the image layers
     result = subprocess.run(
         [
             "podman",
+            "run",
+            "--rm",
+            "--user",
+            "0:0",
+            "-v",
+            f"{temp_dir}:/out:Z",
+            image,
             "cp",
-            f"{container_name}:/build/ghostty-{version}/dist",
-            str(dist_dir),
+            "-R",
+            "--preserve=mode,timestamps",
+            "/build/output/bin/ghostty",
+            f"/build/ghostty-{version}/dist",
+            "/out/",
         ],
         capture_output=True,
         text=True,
     )
 
     if result.returncode != 0:
-        log_error(f"Failed to extract desktop files from container: {result.stderr}")
-        raise RuntimeError("Desktop files extraction failed")
+        log_error(f"Failed to extract artifacts from container: {result.stderr}")
+        raise RuntimeError("Artifact extraction failed")
 
-    log_success("Desktop files extracted successfully")
+    log_success("Artifacts extracted successfully")
 
-    return binary_path, dist_dir
+    return temp_dir / "ghostty", temp_dir / "dist"
 
 
 def build_ghostty_container(
-    version: str, zig_version: str, no_cache: bool
+    version: str, zig_version: str, no_cache: bool, jobs: int
 ) -> None:
     """Build Ghostty using container and install artifacts."""
-    import shutil
-    import random
-    import string
-
     # Check if podman is available
     if not check_podman():
         sys.exit(1)
@@ -491,7 +913,9 @@ def build_ghostty_container(
 
     log_info(f"Building Ghostty {version} using container with Zig {zig_version}...")
 
-    # Build container image
+    # Build container image. The Containerfile builds the Zig toolchain in its
+    # own stage ahead of anything that depends on GHOSTTY_VERSION, so building
+    # a new Ghostty release reuses the cached toolchain layers.
     build_cmd = [
         "podman",
         "build",
@@ -501,6 +925,8 @@ def build_ghostty_container(
         f"GHOSTTY_VERSION={version}",
         "--build-arg",
         f"ZIG_VERSION={zig_version}",
+        "--build-arg",
+        f"ZIG_BUILD_JOBS={jobs}",
         "-f",
         "Containerfile",
         ".",
@@ -510,76 +936,75 @@ def build_ghostty_container(
         build_cmd.insert(2, "--no-cache")
 
     log_info("Building container image (this may take a few minutes)...")
-    result = subprocess.run(build_cmd, capture_output=True, text=True)
+    # Stream build output to the terminal instead of buffering it
+    result = subprocess.run(build_cmd)
 
     if result.returncode != 0:
-        log_error("Container build failed!")
-        if result.stdout:
-            print(result.stdout)
-        if result.stderr:
-            print(result.stderr)
+        log_error(f"Container build failed with exit status {result.returncode}!")
         sys.exit(1)
 
     log_success("Container image built successfully")
 
-    # Generate random suffix for container name
-    random_suffix = "".join(random.choices(string.ascii_lowercase + string.digits, k=8))
-    container_name = f"ghostty-extract-{random_suffix}"
+    # Tag the toolchain stage per Zig version; its layers were just built, so
+    # this is a cache hit and keeps them alive when old builder tags are removed
+    result = subprocess.run(
+        [
+            "podman",
+            "build",
+            "--target",
+            "toolchain",
+            "-t",
+            f"ghostty-builder:zig-{zig_version}",
+            "--build-arg",
+            f"ZIG_VERSION={zig_version}",
+            "-f",
+            "Containerfile",
+            ".",
+        ],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        log_warning(f"Failed to tag Zig toolchain image: {result.stderr}")
+
+    bin_dir = Path.home() / ".local" / "bin"
+    bin_dir.mkdir(parents=True, exist_ok=True)
 
-    # Create temporary directory for extraction
-    temp_dir = Path(tempfile.mkdtemp(prefix="ghostty-container-"))
+    # Create temporary directory for extraction next to the install location,
+    # so the binary can be renamed into place rather than copied out of /tmp
+    temp_dir = Path(tempfile.mkdtemp(prefix=".ghostty-container-", dir=bin_dir))
 
     try:
-        # Create container instance
-        log_info("Creating temporary container for artifact extraction...")
-        result = subprocess.run(
-            [
-                "podman",
-                "create",
-                "--name",
-                container_name,
-                f"ghostty-builder:{version}",
-            ],
-            capture_output=True,
-            text=True,
+        # Extract artifacts
+        binary_path, dist_dir = extract_artifacts_from_container(
+            f"ghostty-builder:{version}", version, temp_dir
         )
 
-        if result.returncode != 0:
-            log_error(f"Failed to create container: {result.stderr}")
-            sys.exit(1)
-
+        # Install binary
+        log_info("Installing binary to ~/.local/bin...")
+        dest_binary = bin_dir / "ghostty"
+        binary_path.chmod(0o755)  # Make executable
         try:
-            # Extract artifacts
-            binary_path, dist_dir = extract_artifacts_from_container(
-                container_name, version, temp_dir
-            )
-
-            # Install binary
-            log_info("Installing binary to ~/.local/bin...")
-            bin_dir = Path.home() / ".local" / "bin"
-            bin_dir.mkdir(parents=True, exist_ok=True)
-
-            dest_binary = bin_dir / "ghostty"
-            shutil.copy2(binary_path, dest_binary)
-            dest_binary.chmod(0o755)  # Make executable
-
-            log_success(f"Binary installed to {dest_binary}")
-
-            # Create a temporary ghostty directory structure for install_desktop_file
-            ghostty_temp_dir = temp_dir / "ghostty-source"
-            ghostty_temp_dir.mkdir(exist_ok=True)
-            shutil.move(str(dist_dir), str(ghostty_temp_dir / "dist"))
-
-            install_desktop_file(ghostty_temp_dir)
-
-        finally:
-            # Remove container
-            log_info("Cleaning up container...")
-            subprocess.run(
-                ["podman", "rm", container_name],
-                capture_output=True,
-            )
-            log_success("Container removed")
+            # A rename is a metadata-only update when both are on one filesystem
+            os.replace(binary_path, dest_binary)
+        except OSError:
+            # Copy next to the destination and rename over it, so a running
+            # Ghostty is never overwritten in place (ETXTBSY, torn binary)
+            tmp_binary = bin_dir / ".ghostty.tmp"
+            try:
+                shutil.copy2(binary_path, tmp_binary)
+                os.replace(tmp_binary, dest_binary)
+            finally:
+                tmp_binary.unlink(missing_ok=True)
+
+        log_success(f"Binary installed to {dest_binary}")
+
+        # Create a temporary ghostty directory structure for install_desktop_file
+        ghostty_temp_dir = temp_dir / "ghostty-source"
+        ghostty_temp_dir.mkdir(exist_ok=True)
+        os.replace(dist_dir, ghostty_temp_dir / "dist")
+
+        install_desktop_file(ghostty_temp_dir)
 
     finally:
         # Clean up temporary directory
@@ -609,6 +1034,7 @@ Examples:
   %(prog)s --skip-build              # Only download and extract source
   %(prog)s --pull-always             # Force re-download all files
   %(prog)s --skip-signature          # Skip signature validation
+  %(prog)s --jobs 4                  # Limit the build to 4 parallel jobs
   %(prog)s 1.2.0 --skip-build --pull-always  # Combine options
 
 The script downloads Ghostty source code, validates signatures, sets up Zig compiler,
@@ -647,7 +1073,7 @@ dependencies locally.
     parser.add_argument(
         "--pull-always",
         action="store_true",
-        help="Always download files even if they already exist in the current directory",
+        help="Always download files even if they already exist in the current directory or the download cache",
     )
     parser.add_argument(
         "--skip-signature",
@@ -659,6 +1085,13 @@ dependencies locally.
         action="store_true",
         help="Skip build and installation steps (only download and extract source code)",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.process_cpu_count() or 1,
+        help="Number of parallel zig build jobs (default: %(default)s)",
+    )
 
     args = parser.parse_args()
     version = args.version
@@ -669,6 +1102,10 @@ dependencies locally.
     pull_always = args.pull_always
     skip_signature = args.skip_signature
     skip_build = args.skip_build
+    jobs = args.jobs
+
+    if jobs < 1:
+        parser.error("--jobs must be at least 1")
 
     # Handle uninstall flag precedence - takes precedence over all other flags
     if uninstall:
@@ -692,7 +1129,7 @@ dependencies locally.
             log_info("Using --no-cache: container will be rebuilt without cache")
 
         # Execute container workflow
-        build_ghostty_container(version, zig_version, no_cache)
+        build_ghostty_container(version, zig_version, no_cache, jobs)
         return
 
     log_info(f"Building Ghostty version {version}")
@@ -701,36 +1138,45 @@ dependencies locally.
     public_key = "untrusted comment: minisign public key 0x23149WL2sEpT\nRWQlAjJC23149WL2sEpT/l0QKy7hMIFhYdQOFy0Z7z7PbneUgvlsnYcV"
 
     # Download files to current working directory
-    # Download Ghostty release
     ghostty_url = (
         f"https://release.files.ghostty.org/{version}/ghostty-{version}.tar.gz"
     )
     ghostty_archive = Path.cwd() / f"ghostty-{version}.tar.gz"
-    download_file(ghostty_url, ghostty_archive, pull_always)
-
-    # Download signature
     signature_url = (
         f"https://release.files.ghostty.org/{version}/ghostty-{version}.tar.gz.minisig"
     )
     signature_file = Path.cwd() / f"ghostty-{version}.tar.gz.minisig"
-    download_file(signature_url, signature_file, pull_always)
-
-    # Validate signature
-    if skip_signature:
-        log_warning("Skipping signature validation (not recommended)")
-    else:
-        if not validate_signature(ghostty_archive, signature_file, public_key):
-            log_error("Signature validation failed, aborting build")
-            sys.exit(1)
 
-    # Extract Ghostty
     ghostty_dir = Path.cwd() / f"ghostty-{version}"
-    if ghostty_dir.exists():
-        import shutil
 
-        shutil.rmtree(ghostty_dir)
+    # Extract into a staging directory while the archive downloads; the tree is
+    # only moved into place once the signature has been validated
+    staging_dir = Path(tempfile.mkdtemp(prefix=".ghostty-staging-", dir=Path.cwd()))
+    try:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            signature_download = executor.submit(
+                download_file, signature_url, signature_file, pull_always
+            )
+            archive_digest = download_and_extract(
+                ghostty_url, ghostty_archive, staging_dir, pull_always
+            )
+            signature_download.result()
 
-    extract_tar_gz(ghostty_archive, Path.cwd())
+        # Validate signature
+        if skip_signature:
+            log_warning("Skipping signature validation (not recommended)")
+        else:
+            if not validate_signature(
+                ghostty_archive, signature_file, public_key, archive_digest
+            ):
+                log_error("Signature validation failed, aborting build")
+                sys.exit(1)
+
+        if ghostty_dir.exists():
+            shutil.rmtree(ghostty_dir)
+        (staging_dir / ghostty_dir.name).rename(ghostty_dir)
+    finally:
+        shutil.rmtree(staging_dir)
 
     if skip_build:
         log_info("Skipping build and installation steps")
@@ -742,7 +1188,7 @@ dependencies locally.
         setup_zig(compiler_dir, zig_version, pull_always)
 
         # Build Ghostty
-        build_ghostty(ghostty_dir, compiler_dir)
+        build_ghostty(ghostty_dir, compiler_dir, jobs)
 
         # Install desktop file
         install_desktop_file(ghostty_dir)